@@ -71,6 +71,23 @@ class Configuration(Generic[HTTPRequestType, HTTPResponseType]):  # pylint: disa
             :caption: Creates the service configuration and adds policies.
     """
 
+    # "__dict__" keeps Configuration open to extra attributes set by callers, such as
+    # storage's create_configuration, while the policy attributes themselves are slots.
+    __slots__ = (
+        "__dict__",
+        "headers_policy",
+        "proxy_policy",
+        "redirect_policy",
+        "retry_policy",
+        "custom_hook_policy",
+        "logging_policy",
+        "http_logging_policy",
+        "user_agent_policy",
+        "authentication_policy",
+        "request_id_policy",
+        "polling_interval",
+    )
+
     def __init__(self, **kwargs: Any) -> None:
         # Headers (sent with every request)
         self.headers_policy: Optional[AnyPolicy[HTTPRequestType, HTTPResponseType]] = None
@@ -40,6 +40,8 @@ HTTPRequestType = TypeVar("HTTPRequestType")
 
 _LOGGER = logging.getLogger(__name__)
 
+_KWARGS_TO_REMOVE = frozenset(("insecure_domain_change", "enable_cae"))
+
 
 def cleanup_kwargs_for_transport(kwargs: Dict[str, str]) -> None:
     """Remove kwargs that are not meant for the transport layer.
@@ -53,11 +55,10 @@ def cleanup_kwargs_for_transport(kwargs: Dict[str, str]) -> None:
       SensitiveHeaderCleanupPolicy is not added into the pipeline and "insecure_domain_change" is not popped.
     "enable_cae" is added to the `get_token` method of the `TokenCredential` protocol.
     """
-    kwargs_to_remove = ["insecure_domain_change", "enable_cae"]
     if not kwargs:
         return
-    for key in kwargs_to_remove:
-        kwargs.pop(key, None)
+    for key in _KWARGS_TO_REMOVE.intersection(kwargs):
+        del kwargs[key]
 
 
 class _SansIOHTTPPolicyRunner(HTTPPolicy[HTTPRequestType, HTTPResponseType]):
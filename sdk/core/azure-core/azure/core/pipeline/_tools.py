@@ -47,8 +47,9 @@ def await_result(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
     :raises: TypeError
     """
     result = func(*args, **kwargs)
-    if hasattr(result, "__await__"):
-        raise TypeError("Policy {} returned awaitable object in non-async pipeline.".format(func))
+    # Look up on the type, as "await" does, so instance __getattr__ hooks are not triggered
+    if getattr(type(result), "__await__", None) is not None:
+        raise TypeError(f"Policy {func} returned awaitable object in non-async pipeline.")
     return result
 
 
@@ -78,7 +79,5 @@ def handle_non_stream_rest_response(response: HttpResponse) -> None:
     """
     try:
         response.read()
+    finally:
         response.close()
-    except Exception as exc:
-        response.close()
-        raise exc
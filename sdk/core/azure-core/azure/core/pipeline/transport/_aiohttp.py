@@ -35,6 +35,9 @@ from typing import (
     Union,
     Type,
     MutableMapping,
+    Tuple,
+    FrozenSet,
+    Dict,
 )
 from types import TracebackType
 from collections.abc import AsyncIterator
@@ -42,6 +45,8 @@ from collections.abc import AsyncIterator
 import logging
 import asyncio
 import codecs
+import ssl
+import zlib
 import aiohttp
 import aiohttp.client_exceptions
 from multidict import CIMultiDict
@@ -111,7 +116,15 @@ class AioHttpTransport(AsyncHttpTransport):
         if not self._session_owner and not self.session:
             raise ValueError("session_owner cannot be False if no session is provided")
         self.connection_config = ConnectionConfiguration(**kwargs)
+        self._default_timeout = aiohttp.ClientTimeout(
+            sock_connect=self.connection_config.timeout, sock_read=self.connection_config.read_timeout
+        )
         self._use_env_settings = kwargs.pop("use_env_settings", True)
+        # Protocols of the last seen proxies mapping, sorted by longest string first
+        self._proxy_cache: Optional[Tuple[FrozenSet[str], Tuple[str, ...]]] = None
+        self._auto_decompress: Optional[bool] = None
+        self._opened = False
+        self._ssl_cache: Dict[Tuple[Any, Any], ssl.SSLContext] = {}
 
     async def __aenter__(self):
         await self.open()
@@ -127,6 +140,8 @@ class AioHttpTransport(AsyncHttpTransport):
 
     async def open(self):
         """Opens the connection."""
+        if self._opened:
+            return
         if not self.session and self._session_owner:
             jar = aiohttp.DummyCookieJar()
             clientsession_kwargs = {
@@ -140,6 +155,9 @@ class AioHttpTransport(AsyncHttpTransport):
         # pyright has trouble to understand that self.session is not None, since we raised at worst in the init
         self.session = cast(aiohttp.ClientSession, self.session)
         await self.session.__aenter__()
+        # auto_decompress is introduced in aiohttp 3.7. We need this to handle aiohttp 3.6-.
+        self._auto_decompress = getattr(self.session, "auto_decompress", False)
+        self._opened = True
 
     async def close(self):
         """Closes the connection."""
@@ -147,26 +165,40 @@ class AioHttpTransport(AsyncHttpTransport):
             await self.session.close()
             self._session_owner = False
             self.session = None
+        self._auto_decompress = None
+        self._opened = False
+        self._ssl_cache.clear()
 
     def _build_ssl_config(self, cert, verify):
         """Build the SSL configuration.
 
+        SSL contexts are cached per (cert, verify) setting for as long as the transport is open,
+        so cert and CA files are read once. A cert or CA bundle rotated on disk under the same path
+        is picked up after the transport is closed and reopened.
+
         :param tuple cert: Cert information
         :param bool verify: SSL verification or path to CA file or directory
         :rtype: bool or str or ssl.SSLContext
         :return: SSL Configuration
         """
-        ssl_ctx = None
-
         if cert or verify not in (True, False):
-            import ssl
-
+            # Building a context loads the CA bundle and cert chain, so reuse it for identical settings.
+            # Only hashable values (str, Path, tuple) can be keyed on, anything else builds a new context.
+            key: Optional[Tuple[Any, Any]] = (cert, verify)
+            try:
+                return self._ssl_cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                key = None
             if verify not in (True, False):
                 ssl_ctx = ssl.create_default_context(cafile=verify)
             else:
                 ssl_ctx = ssl.create_default_context()
             if cert:
                 ssl_ctx.load_cert_chain(*cert)
+            if key is not None:
+                self._ssl_cache[key] = ssl_ctx
             return ssl_ctx
         return verify
 
@@ -180,12 +212,16 @@ class AioHttpTransport(AsyncHttpTransport):
         """
         if request.files:
             form_data = aiohttp.FormData(request.data or {})
+            add_field = form_data.add_field
             for form_file, data in request.files.items():
-                content_type = data[2] if len(data) > 2 else None
-                try:
-                    form_data.add_field(form_file, data[1], filename=data[0], content_type=content_type)
-                except IndexError as err:
-                    raise ValueError("Invalid formdata formatting: {}".format(data)) from err
+                if len(data) == 2:
+                    filename, value = data
+                    content_type = None
+                elif len(data) > 2:
+                    filename, value, content_type = data[0], data[1], data[2]
+                else:
+                    raise ValueError("Invalid formdata formatting: {}".format(data))
+                add_field(form_file, value, filename=filename, content_type=content_type)
             return form_data
         return request.data
 
@@ -257,30 +293,30 @@ class AioHttpTransport(AsyncHttpTransport):
         :keyword MutableMapping proxies: dict of proxy to used based on protocol. Proxy is a dict (protocol, url)
         """
         await self.open()
-        try:
-            auto_decompress = self.session.auto_decompress  # type: ignore
-        except AttributeError:
-            # auto_decompress is introduced in aiohttp 3.7. We need this to handle aiohttp 3.6-.
-            auto_decompress = False
+        auto_decompress = self._auto_decompress
 
         proxy = config.pop("proxy", None)
         if proxies and not proxy:
             # aiohttp needs a single proxy, so iterating until we found the right protocol
 
             # Sort by longest string first, so "http" is not used for "https" ;-)
-            for protocol in sorted(proxies.keys(), reverse=True):
-                if request.url.startswith(protocol):
+            # The proxies mapping rarely changes between requests, so the sorted order is cached.
+            if self._proxy_cache is None or proxies.keys() != self._proxy_cache[0]:
+                self._proxy_cache = (frozenset(proxies), tuple(sorted(proxies, reverse=True)))
+            url = request.url
+            for protocol in self._proxy_cache[1]:
+                if url.startswith(protocol):
                     proxy = proxies[protocol]
                     break
 
         response: Optional[Union[AsyncHttpResponse, RestAsyncHttpResponse]] = None
-        ssl = self._build_ssl_config(
+        ssl_config = self._build_ssl_config(
             cert=config.pop("connection_cert", self.connection_config.cert),
             verify=config.pop("connection_verify", self.connection_config.verify),
         )
         # If ssl=True, we just use default ssl context from aiohttp
-        if ssl is not True:
-            config["ssl"] = ssl
+        if ssl_config is not True:
+            config["ssl"] = ssl_config
         # If we know for sure there is not body, disable "auto content type"
         # Otherwise, aiohttp will send "application/octet-stream" even for empty POST request
         # and that break services like storage signature
@@ -288,9 +324,12 @@ class AioHttpTransport(AsyncHttpTransport):
             config["skip_auto_headers"] = ["Content-Type"]
         try:
             stream_response = stream
-            timeout = config.pop("connection_timeout", self.connection_config.timeout)
-            read_timeout = config.pop("read_timeout", self.connection_config.read_timeout)
-            socket_timeout = aiohttp.ClientTimeout(sock_connect=timeout, sock_read=read_timeout)
+            if "connection_timeout" in config or "read_timeout" in config:
+                timeout = config.pop("connection_timeout", self.connection_config.timeout)
+                read_timeout = config.pop("read_timeout", self.connection_config.read_timeout)
+                socket_timeout = aiohttp.ClientTimeout(sock_connect=timeout, sock_read=read_timeout)
+            else:
+                socket_timeout = self._default_timeout
             result = await self.session.request(  # type: ignore
                 request.method,
                 request.url,
@@ -324,9 +363,7 @@ class AioHttpTransport(AsyncHttpTransport):
                 )
                 if not stream_response:
                     await response.load_body()
-        except aiohttp.client_exceptions.ClientResponseError as err:
-            raise ServiceResponseError(err, error=err) from err
-        except asyncio.TimeoutError as err:
+        except (aiohttp.client_exceptions.ClientResponseError, asyncio.TimeoutError) as err:
             raise ServiceResponseError(err, error=err) from err
         except aiohttp.client_exceptions.ClientError as err:
             raise ServiceRequestError(err, error=err) from err
@@ -377,50 +414,57 @@ class AioHttpStreamDownloadGenerator(AsyncIterator):
         self.block_size = response.block_size
         self._decompress = decompress
         internal_response = response.internal_response
-        self.content_length = int(internal_response.headers.get("Content-Length", 0))
+        content_length = internal_response.headers.get("Content-Length")
+        self.content_length = int(content_length) if content_length is not None else 0
+        # Content-Encoding doesn't change mid-stream, so resolve the zlib mode (if any) once
+        self._zlib_mode: Optional[int] = None
+        if decompress:
+            enc = (internal_response.headers.get("Content-Encoding") or "").lower()
+            if enc == "gzip":
+                self._zlib_mode = 16 + zlib.MAX_WBITS
+            elif enc == "deflate":
+                self._zlib_mode = -zlib.MAX_WBITS
         self._decompressor = None
+        # Bound once, as it is called for every chunk of the download
+        self._read = internal_response.content.read
 
     def __len__(self):
         return self.content_length
 
     async def __anext__(self):
-        internal_response = self.response.internal_response
         try:
-            chunk = await internal_response.content.read(self.block_size)
+            # Output is capped at block_size, so drain any compressed input left over before reading more
+            if self._decompressor and self._decompressor.unconsumed_tail:
+                return self._decompressor.decompress(self._decompressor.unconsumed_tail, self.block_size)
+            chunk = await self._read(self.block_size)
             if not chunk:
+                # All input can be consumed while output is still pending in the decompressor
+                if self._decompressor and not self._decompressor.eof:
+                    pending = self._decompressor.decompress(b"", self.block_size)
+                    if pending:
+                        return pending
                 raise _ResponseStopIteration()
-            if not self._decompress:
+            if self._zlib_mode is None:
                 return chunk
-            enc = internal_response.headers.get("Content-Encoding")
-            if not enc:
-                return chunk
-            enc = enc.lower()
-            if enc in ("gzip", "deflate"):
-                if not self._decompressor:
-                    import zlib
-
-                    zlib_mode = (16 + zlib.MAX_WBITS) if enc == "gzip" else -zlib.MAX_WBITS
-                    self._decompressor = zlib.decompressobj(wbits=zlib_mode)
-                chunk = self._decompressor.decompress(chunk)
-            return chunk
+            if not self._decompressor:
+                self._decompressor = zlib.decompressobj(wbits=self._zlib_mode)
+            return self._decompressor.decompress(chunk, self.block_size)
         except _ResponseStopIteration:
-            internal_response.close()
+            self.response.internal_response.close()
             raise StopAsyncIteration()  # pylint: disable=raise-missing-from
         except aiohttp.client_exceptions.ClientPayloadError as err:
             # This is the case that server closes connection before we finish the reading. aiohttp library
             # raises ClientPayloadError.
             _LOGGER.warning("Incomplete download: %s", err)
-            internal_response.close()
+            self.response.internal_response.close()
             raise IncompleteReadError(err, error=err) from err
-        except aiohttp.client_exceptions.ClientResponseError as err:
-            raise ServiceResponseError(err, error=err) from err
-        except asyncio.TimeoutError as err:
+        except (aiohttp.client_exceptions.ClientResponseError, asyncio.TimeoutError) as err:
             raise ServiceResponseError(err, error=err) from err
         except aiohttp.client_exceptions.ClientError as err:
             raise ServiceRequestError(err, error=err) from err
         except Exception as err:
             _LOGGER.warning("Unable to stream download: %s", err)
-            internal_response.close()
+            self.response.internal_response.close()
             raise
 
 
@@ -518,9 +562,7 @@ class AioHttpTransportResponse(AsyncHttpResponse):
             # This is the case that server closes connection before we finish the reading. aiohttp library
             # raises ClientPayloadError.
             raise IncompleteReadError(err, error=err) from err
-        except aiohttp.client_exceptions.ClientResponseError as err:
-            raise ServiceResponseError(err, error=err) from err
-        except asyncio.TimeoutError as err:
+        except (aiohttp.client_exceptions.ClientResponseError, asyncio.TimeoutError) as err:
             raise ServiceResponseError(err, error=err) from err
         except aiohttp.client_exceptions.ClientError as err:
             raise ServiceRequestError(err, error=err) from err
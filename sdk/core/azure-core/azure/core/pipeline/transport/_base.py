@@ -30,7 +30,9 @@ import json
 import logging
 import time
 import copy
-from urllib.parse import urlparse
+import functools
+import re
+from urllib.parse import urlsplit
 import xml.etree.ElementTree as ET
 
 from typing import (
@@ -81,6 +83,16 @@ _LOGGER = logging.getLogger(__name__)
 
 binary_type = str
 
+# Any other casing still goes through urlsplit in PipelineClientBase.format_url
+_ABSOLUTE_URL_PREFIXES = ("https://", "http://", "HTTPS://", "HTTP://")
+
+# A scheme as urlsplit recognizes it: an ASCII letter, then letters, digits, "+", "-" or "."
+_URL_SCHEME = re.compile(r"[A-Za-z][A-Za-z0-9+\-.]*:")
+
+# Matches escaped braces, or a replacement field that is a plain keyword name (no attribute, index,
+# conversion or format spec), which is what "format" reports in the KeyError when it is missing
+_URL_FORMAT_FIELD = re.compile(r"\{\{|\}\}|\{([^{}.\[!:]+)\}")
+
 
 def _format_url_section(template, **kwargs: Dict[str, str]) -> str:
     """String format the template with the kwargs, auto-skip sections of the template that are NOT in the kwargs.
@@ -94,23 +106,46 @@ def _format_url_section(template, **kwargs: Dict[str, str]) -> str:
     :rtype: str
     :returns: Template completed
     """
-    last_template = template
-    components = template.split("/")
-    while components:
-        try:
-            return template.format(**kwargs)
-        except KeyError as key:
-            formatted_components = template.split("/")
-            components = [c for c in formatted_components if "{{{}}}".format(key.args[0]) not in c]
-            template = "/".join(components)
-            if last_template == template:
-                raise ValueError(
-                    f"The value provided for the url part '{template}' was incorrect, and resulted in an invalid url"
-                ) from key
-            last_template = template
-    return last_template
+    # Only plain str values are cached: other types could compare equal yet format differently (1 and True)
+    if all(type(value) is str for value in kwargs.values()):  # pylint: disable=unidiomatic-typecheck
+        return _format_url_section_cached(template, tuple(sorted(kwargs.items())))
+    return _format_url_section_uncached(template, kwargs)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_url_section_cached(template: str, kwargs_items: Tuple[Tuple[str, str], ...]) -> str:
+    return _format_url_section_uncached(template, dict(kwargs_items))
+
+
+def _has_missing_url_field(template: str, kwargs: Mapping[str, Any]) -> bool:
+    for field in _URL_FORMAT_FIELD.finditer(template):
+        key = field.group(1)
+        if key is not None and key not in kwargs and not key.isdigit():
+            return True
+    return False
 
 
+def _format_url_section_uncached(template: str, kwargs: Mapping[str, Any]) -> str:
+    # Usually every parameter is provided, so only look at each section when something is missing
+    if _has_missing_url_field(template, kwargs):
+        template = "/".join(c for c in template.split("/") if not _has_missing_url_field(c, kwargs))
+    try:
+        return template.format_map(kwargs)
+    except KeyError as key:
+        # A missing name that is not a plain field, like "{aaa.bbb}", can't be skipped
+        raise ValueError(
+            f"The value provided for the url part '{template}' was incorrect, and resulted in an invalid url"
+        ) from key
+
+
+def _join_url_path(base_path: str, stub_path: str) -> str:
+    # Base URLs are usually already stripped by format_url, so only pay for rstrip when needed
+    if base_path.endswith("/"):
+        base_path = base_path.rstrip("/")
+    return base_path + "/" + stub_path
+
+
+@functools.lru_cache(maxsize=1024)
 def _urljoin(base_url: str, stub_url: str) -> str:
     """Append to end of base URL without losing query parameters.
 
@@ -119,25 +154,46 @@ def _urljoin(base_url: str, stub_url: str) -> str:
     :returns: The updated URL.
     :rtype: str
     """
-    parsed_base_url = urlparse(base_url)
+    # Lowercase the scheme like urlsplit does, the string paths below don't go through it
+    scheme_match = _URL_SCHEME.match(base_url)
+    if scheme_match and not scheme_match.group().islower():
+        base_url = scheme_match.group().lower() + base_url[scheme_match.end() :]
 
-    # Can't use "urlparse" on a partial url, we get incorrect parsing for things like
+    # Can't use "urlsplit" on a partial url, we get incorrect parsing for things like
     # document:build?format=html&api-version=2019-05-01
-    split_url = stub_url.split("?", 1)
-    stub_url_path = split_url.pop(0)
-    stub_url_query = split_url.pop() if split_url else None
-
-    # Note that _replace is a public API named that way to avoid conflicts in namedtuple
-    # https://docs.python.org/3/library/collections.html?highlight=namedtuple#collections.namedtuple
-    parsed_base_url = parsed_base_url._replace(
-        path=parsed_base_url.path.rstrip("/") + "/" + stub_url_path,
-    )
+    stub_url_path, _, stub_url_query = stub_url.partition("?")
+
+    if not stub_url_query and "?" not in base_url and "#" not in base_url:
+        # No query or fragment to carry over, which is the common case
+        return _join_url_path(base_url, stub_url_path)
+
+    if "://" in base_url:
+        # Only the end of the path and the query change, so the base URL doesn't need a full parse
+        base_url, _, fragment = base_url.partition("#")
+        base_url, _, base_url_query = base_url.partition("?")
+        url = _join_url_path(base_url, stub_url_path)
+        if base_url_query and stub_url_query:
+            url += "?" + base_url_query + "&" + stub_url_query
+        elif base_url_query or stub_url_query:
+            url += "?" + (base_url_query or stub_url_query)
+        if fragment:
+            url += "#" + fragment
+        return url
+
+    scheme, netloc, path, query, fragment = urlsplit(base_url)
+    # Rebuild from the parsed components directly rather than through _replace and geturl
+    url = _join_url_path(path, stub_url_path)
+    if netloc:
+        url = "//" + netloc + url
+    if scheme:
+        url = scheme + ":" + url
     if stub_url_query:
-        query_params = [stub_url_query]
-        if parsed_base_url.query:
-            query_params.insert(0, parsed_base_url.query)
-        parsed_base_url = parsed_base_url._replace(query="&".join(query_params))
-    return parsed_base_url.geturl()
+        query = query + "&" + stub_url_query if query else stub_url_query
+    if query:
+        url += "?" + query
+    if fragment:
+        url += "#" + fragment
+    return url
 
 
 class HttpTransport(ContextManager["HttpTransport"], abc.ABC, Generic[HTTPRequestType, HTTPResponseType]):
@@ -171,9 +227,20 @@ class HttpTransport(ContextManager["HttpTransport"], abc.ABC, Generic[HTTPReques
         consistent, it's cleaner to always ask the transport to sleep and let the transport
         implementor decide how to do it.
 
+        Durations below one millisecond are shorter than the OS scheduler latency of
+        ``time.sleep``, so they are waited out by polling ``time.monotonic`` instead.
+        This keeps the calling thread busy for that (sub-millisecond) duration, but each
+        poll goes through ``time.sleep(0)``, which releases the GIL so other Python threads
+        still get to run.
+
         :param float duration: The number of seconds to sleep.
         """
-        time.sleep(duration)
+        if 0 < duration < 0.001:
+            deadline = time.monotonic() + duration
+            while time.monotonic() < deadline:
+                time.sleep(0)
+        else:
+            time.sleep(duration)
 
 
 class HttpRequest:
@@ -230,7 +297,7 @@ class HttpRequest:
         :rtype: dict[str, str]
         :return: The query parameters of the request as a dict.
         """
-        query = urlparse(self.url).query
+        query = urlsplit(self.url).query
         if query:
             return {p[0]: p[-1] for p in [p.partition("=") for p in query.split("&")]}
         return {}
@@ -581,9 +648,23 @@ class PipelineClientBase:
     :param str base_url: URL for the request.
     """
 
+    __slots__ = ("_base_url_template", "_static_base_url")
+
     def __init__(self, base_url: str):
         self._base_url = base_url
 
+    @property
+    def _base_url(self) -> str:
+        return self._base_url_template
+
+    @_base_url.setter
+    def _base_url(self, base_url: str) -> None:
+        self._base_url_template = base_url
+        # Most base URLs have nothing to format, so they can be prepared once instead of on every request
+        self._static_base_url: Optional[str] = None
+        if base_url and "{" not in base_url and "}" not in base_url:
+            self._static_base_url = base_url.rstrip("/")
+
     def _request(
         self,
         method: str,
@@ -656,16 +737,26 @@ class PipelineClientBase:
         """
         url = _format_url_section(url_template, **kwargs)
         if url:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
+            # If the URL is already absolute, with a host, avoid parsing and joining it
+            if url.startswith(_ABSOLUTE_URL_PREFIXES):
+                host_start = url.index("://") + 3
+                if url[host_start : host_start + 1] not in ("", "/", "?", "#"):
+                    return url
+            # Without "://" there can't be both a scheme and a netloc, so only parse when it's present
+            parsed = urlsplit(url) if "://" in url else None
+            if parsed is None or not parsed.scheme or not parsed.netloc:
                 url = url.lstrip("/")
-                try:
-                    base = self._base_url.format(**kwargs).rstrip("/")
-                except KeyError as key:
-                    err_msg = "The value provided for the url part {} was incorrect, and resulted in an invalid url"
-                    raise ValueError(err_msg.format(key.args[0])) from key
+                base = self._static_base_url
+                if base is None:
+                    try:
+                        base = self._base_url.format(**kwargs).rstrip("/")
+                    except KeyError as key:
+                        err_msg = "The value provided for the url part {} was incorrect, and resulted in an invalid url"
+                        raise ValueError(err_msg.format(key.args[0])) from key
 
                 url = _urljoin(base, url)
+        elif self._static_base_url is not None:
+            url = self._base_url
         else:
             url = self._base_url.format(**kwargs)
         return url
@@ -689,9 +780,7 @@ class PipelineClientBase:
         :return: An HttpRequest object
         :rtype: ~azure.core.pipeline.transport.HttpRequest
         """
-        request = self._request("GET", url, params, headers, content, form_content, None)
-        request.method = "GET"
-        return request
+        return self._request("GET", url, params, headers, content, form_content, None)
 
     def put(
         self,
@@ -715,8 +804,7 @@ class PipelineClientBase:
         :return: An HttpRequest object
         :rtype: ~azure.core.pipeline.transport.HttpRequest
         """
-        request = self._request("PUT", url, params, headers, content, form_content, stream_content)
-        return request
+        return self._request("PUT", url, params, headers, content, form_content, stream_content)
 
     def post(
         self,
@@ -740,8 +828,7 @@ class PipelineClientBase:
         :return: An HttpRequest object
         :rtype: ~azure.core.pipeline.transport.HttpRequest
         """
-        request = self._request("POST", url, params, headers, content, form_content, stream_content)
-        return request
+        return self._request("POST", url, params, headers, content, form_content, stream_content)
 
     def head(
         self,
@@ -765,8 +852,7 @@ class PipelineClientBase:
         :return: An HttpRequest object
         :rtype: ~azure.core.pipeline.transport.HttpRequest
         """
-        request = self._request("HEAD", url, params, headers, content, form_content, stream_content)
-        return request
+        return self._request("HEAD", url, params, headers, content, form_content, stream_content)
 
     def patch(
         self,
@@ -790,8 +876,7 @@ class PipelineClientBase:
         :return: An HttpRequest object
         :rtype: ~azure.core.pipeline.transport.HttpRequest
         """
-        request = self._request("PATCH", url, params, headers, content, form_content, stream_content)
-        return request
+        return self._request("PATCH", url, params, headers, content, form_content, stream_content)
 
     def delete(
         self,
@@ -812,8 +897,7 @@ class PipelineClientBase:
         :return: An HttpRequest object
         :rtype: ~azure.core.pipeline.transport.HttpRequest
         """
-        request = self._request("DELETE", url, params, headers, content, form_content, None)
-        return request
+        return self._request("DELETE", url, params, headers, content, form_content, None)
 
     def merge(
         self,
@@ -834,8 +918,7 @@ class PipelineClientBase:
         :return: An HttpRequest object
         :rtype: ~azure.core.pipeline.transport.HttpRequest
         """
-        request = self._request("MERGE", url, params, headers, content, form_content, None)
-        return request
+        return self._request("MERGE", url, params, headers, content, form_content, None)
 
     def options(
         self,  # pylint: disable=unused-argument
@@ -858,5 +941,4 @@ class PipelineClientBase:
         :return: An HttpRequest object
         :rtype: ~azure.core.pipeline.transport.HttpRequest
         """
-        request = self._request("OPTIONS", url, params, headers, content, form_content, None)
-        return request
+        return self._request("OPTIONS", url, params, headers, content, form_content, None)
@@ -33,9 +33,11 @@ from ._http_response_impl_async import (
     AsyncHttpResponseBackcompatMixin,
 )
 from ..pipeline.transport._aiohttp import AioHttpStreamDownloadGenerator
-from ..utils._pipeline_transport_rest_shared import _pad_attr_name, _aiohttp_body_helper
+from ..utils._pipeline_transport_rest_shared import _pad_attr_name, _padded_attr_names, _aiohttp_body_helper
 from ..exceptions import ResponseNotReadError
 
+_LOAD_BODY_BACKCOMPAT_ATTRS = _padded_attr_names("load_body")
+
 
 class _ItemsView(collections.abc.ItemsView):
     def __init__(self, ref):
@@ -165,8 +167,7 @@ class _RestAioHttpTransportResponseBackcompatMixin(AsyncHttpResponseBackcompatMi
         self._content = await self.read()  # type: ignore
 
     def __getattr__(self, attr):
-        backcompat_attrs = ["load_body"]
-        attr = _pad_attr_name(attr, backcompat_attrs)
+        attr = _pad_attr_name(attr, _LOAD_BODY_BACKCOMPAT_ATTRS)
         return super().__getattr__(attr)
 
 
@@ -49,6 +49,7 @@ from azure.core.serialization import AzureJSONEncoder
 from ..utils._pipeline_transport_rest_shared import (
     _format_parameters_helper,
     _pad_attr_name,
+    _padded_attr_names,
     _prepare_multipart_body_helper,
     _serialize_request,
     _format_data_helper,
@@ -186,36 +187,38 @@ def decode_to_text(encoding: Optional[str], content: bytes) -> str:
     return codecs.getincrementaldecoder("utf-8-sig")(errors="replace").decode(content)
 
 
+_REQUEST_BACKCOMPAT_GETATTRS = _padded_attr_names(
+    "files",
+    "data",
+    "multipart_mixed_info",
+    "query",
+    "body",
+    "format_parameters",
+    "set_streamed_data_body",
+    "set_text_body",
+    "set_xml_body",
+    "set_json_body",
+    "set_formdata_body",
+    "set_bytes_body",
+    "set_multipart_mixed",
+    "prepare_multipart_body",
+    "serialize",
+)
+_REQUEST_BACKCOMPAT_SETATTRS = _padded_attr_names(
+    "multipart_mixed_info",
+    "files",
+    "data",
+    "body",
+)
+
+
 class HttpRequestBackcompatMixin:
     def __getattr__(self, attr: str) -> Any:
-        backcompat_attrs = [
-            "files",
-            "data",
-            "multipart_mixed_info",
-            "query",
-            "body",
-            "format_parameters",
-            "set_streamed_data_body",
-            "set_text_body",
-            "set_xml_body",
-            "set_json_body",
-            "set_formdata_body",
-            "set_bytes_body",
-            "set_multipart_mixed",
-            "prepare_multipart_body",
-            "serialize",
-        ]
-        attr = _pad_attr_name(attr, backcompat_attrs)
+        attr = _pad_attr_name(attr, _REQUEST_BACKCOMPAT_GETATTRS)
         return self.__getattribute__(attr)
 
     def __setattr__(self, attr: str, value: Any) -> None:
-        backcompat_attrs = [
-            "multipart_mixed_info",
-            "files",
-            "data",
-            "body",
-        ]
-        attr = _pad_attr_name(attr, backcompat_attrs)
+        attr = _pad_attr_name(attr, _REQUEST_BACKCOMPAT_SETATTRS)
         super(HttpRequestBackcompatMixin, self).__setattr__(attr, value)
 
     @property
@@ -44,12 +44,31 @@ from ._rest_py3 import (
 from ..utils._utils import case_insensitive_dict
 from ..utils._pipeline_transport_rest_shared import (
     _pad_attr_name,
+    _padded_attr_names,
     BytesIOSocket,
     _decode_parts_helper,
     _get_raw_parts_helper,
     _parts_helper,
 )
 
+_RESPONSE_BACKCOMPAT_GETATTRS = _padded_attr_names(
+    "body",
+    "internal_response",
+    "block_size",
+    "stream_download",
+)
+_RESPONSE_BACKCOMPAT_SETATTRS = _padded_attr_names(
+    "block_size",
+    "internal_response",
+    "request",
+    "status_code",
+    "headers",
+    "reason",
+    "content_type",
+    "stream_download",
+)
+_PARTS_BACKCOMPAT_ATTRS = _padded_attr_names("parts")
+
 
 class _HttpResponseBackcompatMixinBase:
     """Base Backcompat mixin for responses.
@@ -59,27 +78,11 @@ class _HttpResponseBackcompatMixinBase:
     """
 
     def __getattr__(self, attr):
-        backcompat_attrs = [
-            "body",
-            "internal_response",
-            "block_size",
-            "stream_download",
-        ]
-        attr = _pad_attr_name(attr, backcompat_attrs)
+        attr = _pad_attr_name(attr, _RESPONSE_BACKCOMPAT_GETATTRS)
         return self.__getattribute__(attr)
 
     def __setattr__(self, attr, value):
-        backcompat_attrs = [
-            "block_size",
-            "internal_response",
-            "request",
-            "status_code",
-            "headers",
-            "reason",
-            "content_type",
-            "stream_download",
-        ]
-        attr = _pad_attr_name(attr, backcompat_attrs)
+        attr = _pad_attr_name(attr, _RESPONSE_BACKCOMPAT_SETATTRS)
         super(_HttpResponseBackcompatMixinBase, self).__setattr__(attr, value)
 
     def _body(self):
@@ -154,8 +157,7 @@ class HttpResponseBackcompatMixin(_HttpResponseBackcompatMixinBase):
     """Backcompat mixin for sync HttpResponses"""
 
     def __getattr__(self, attr):
-        backcompat_attrs = ["parts"]
-        attr = _pad_attr_name(attr, backcompat_attrs)
+        attr = _pad_attr_name(attr, _PARTS_BACKCOMPAT_ATTRS)
         return super(HttpResponseBackcompatMixin, self).__getattr__(attr)
 
     def parts(self):
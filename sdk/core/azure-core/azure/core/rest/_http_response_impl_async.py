@@ -30,6 +30,7 @@ from ._http_response_impl import (
     _HttpResponseBaseImpl,
     _HttpResponseBackcompatMixinBase,
     _RestHttpClientTransportResponseBase,
+    _PARTS_BACKCOMPAT_ATTRS,
 )
 from ..utils._pipeline_transport_rest_shared import _pad_attr_name
 from ..utils._pipeline_transport_rest_shared_async import _PartGenerator
@@ -39,8 +40,7 @@ class AsyncHttpResponseBackcompatMixin(_HttpResponseBackcompatMixinBase):
     """Backcompat mixin for async responses"""
 
     def __getattr__(self, attr):
-        backcompat_attrs = ["parts"]
-        attr = _pad_attr_name(attr, backcompat_attrs)
+        attr = _pad_attr_name(attr, _PARTS_BACKCOMPAT_ATTRS)
         return super().__getattr__(attr)
 
     def parts(self):
@@ -8,11 +8,13 @@ from __future__ import absolute_import
 
 from io import BytesIO
 from email.message import Message
-from email.policy import HTTP
 from email import message_from_bytes as message_parser
 import os
+import re
+import uuid
 from typing import (
     TYPE_CHECKING,
+    Any,
     cast,
     IO,
     Union,
@@ -23,9 +25,9 @@ from typing import (
     Iterator,
     List,
     Sequence,
+    Mapping,
 )
-from http.client import HTTPConnection
-from urllib.parse import urlparse
+from http.client import InvalidURL
 
 from ..pipeline import (
     PipelineRequest,
@@ -51,7 +53,15 @@ if TYPE_CHECKING:
         _HttpResponseBase as PipelineTransportHttpResponseBase,
     )
 
-binary_type = str
+# Connection level headers, which have no place in a serialized sub-request
+_SKIP_HEADERS = frozenset(("Host", "Accept-Encoding"))
+_METHODS_EXPECTING_BODY = frozenset(("PATCH", "POST", "PUT"))
+_BODY_READ_SIZE = 8192
+# Same checks http.client runs, so a sub-request can't smuggle extra lines into the batch body
+_ILLEGAL_METHOD_CHARS = re.compile(r"[\x00-\x1f]")
+_ILLEGAL_URL_CHARS = re.compile(r"[\x00-\x20\x7f]")
+_LEGAL_HEADER_NAME = re.compile(rb"[^:\s][^:\r\n]*")
+_ILLEGAL_HEADER_VALUE_CHARS = re.compile(rb"\n(?![ \t])|\r(?![ \t\n])")
 
 
 class BytesIOSocket:
@@ -81,27 +91,39 @@ def _format_parameters_helper(http_request, params):
     :type http_request: any
     :param dict params: A dictionary of parameters.
     """
-    query = urlparse(http_request.url).query
+    base_url, _, query = http_request.url.partition("?")
+    # Same query urlsplit would find: nothing if the '?' is part of the fragment
+    query = "" if "#" in base_url else query.partition("#")[0]
     if query:
-        http_request.url = http_request.url.partition("?")[0]
-        existing_params = {p[0]: p[-1] for p in [p.partition("=") for p in query.split("&")]}
+        http_request.url = base_url
+        existing_params = dict(p.partition("=")[::2] for p in query.split("&"))
         params.update(existing_params)
-    query_params = []
+    query_params: List[str] = []
+    append = query_params.append
     for k, v in params.items():
         if isinstance(v, list):
             for w in v:
                 if w is None:
-                    raise ValueError("Query parameter {} cannot be None".format(k))
-                query_params.append("{}={}".format(k, w))
+                    raise ValueError(f"Query parameter {k} cannot be None")
+                append(f"{k}={w}")
+        elif v is None:
+            raise ValueError(f"Query parameter {k} cannot be None")
         else:
-            if v is None:
-                raise ValueError("Query parameter {} cannot be None".format(k))
-            query_params.append("{}={}".format(k, v))
-    query = "?" + "&".join(query_params)
-    http_request.url = http_request.url + query
+            append(f"{k}={v}")
+    http_request.url = f"{http_request.url}?{'&'.join(query_params)}"
 
 
-def _pad_attr_name(attr: str, backcompat_attrs: Sequence[str]) -> str:
+def _padded_attr_names(*backcompat_attrs: str) -> Mapping[str, str]:
+    """Build the lookup table used by _pad_attr_name.
+
+    :param str backcompat_attrs: The backcompat attribute names
+    :rtype: Mapping[str, str]
+    :return: A mapping of each backcompat attribute to its padded name
+    """
+    return {attr: "_" + attr for attr in backcompat_attrs}
+
+
+def _pad_attr_name(attr: str, backcompat_attrs: Mapping[str, str]) -> str:
     """Pad hidden attributes so users can access them.
 
     Currently, for our backcompat attributes, we define them
@@ -112,11 +134,30 @@ def _pad_attr_name(attr: str, backcompat_attrs: Sequence[str]) -> str:
     we can return them the private variable in getattr
 
     :param str attr: The attribute name
-    :param list[str] backcompat_attrs: The list of backcompat attributes
+    :param backcompat_attrs: The backcompat attributes, as built by _padded_attr_names
+    :type backcompat_attrs: Mapping[str, str]
     :rtype: str
     :return: The padded attribute name
     """
-    return "_{}".format(attr) if attr in backcompat_attrs else attr
+    return backcompat_attrs.get(attr, attr)
+
+
+def _part_bytes(payload: Union[bytes, memoryview], content_type: str, content_id: Optional[int] = None) -> bytes:
+    """Serialize one part of a multipart/mixed body.
+
+    :param payload: The part payload
+    :type payload: bytes or memoryview
+    :param str content_type: The Content-Type of the part
+    :param int content_id: The Content-ID of a sub-request part. Nested changesets have none.
+    :rtype: bytes
+    :return: The part headers, followed by a blank line and the payload
+    """
+    content_type_header = b"Content-Type: %s\r\n" % content_type.encode("ascii")
+    if content_id is None:
+        return b"".join((content_type_header, b"\r\n", payload))
+    return b"".join(
+        (content_type_header, b"Content-Transfer-Encoding: binary\r\nContent-ID: %d\r\n\r\n" % content_id, payload)
+    )
 
 
 def _prepare_multipart_body_helper(http_request: "HTTPRequestType", content_index: int = 0) -> int:
@@ -141,57 +182,151 @@ def _prepare_multipart_body_helper(http_request: "HTTPRequestType", content_inde
     requests: Sequence["HTTPRequestType"] = http_request.multipart_mixed_info[0]
     boundary: Optional[str] = http_request.multipart_mixed_info[2]
 
-    # Update the main request with the body
-    main_message = Message()
-    main_message.add_header("Content-Type", "multipart/mixed")
-    if boundary:
-        main_message.set_boundary(boundary)
+    if not boundary:
+        boundary = uuid.uuid4().hex
+    delimiter = b"--" + boundary.encode("ascii")
 
+    parts: List[bytes] = []
+    append = parts.append
     for req in requests:
-        part_message = Message()
         if req.multipart_mixed_info:
             content_index = req.prepare_multipart_body(content_index=content_index)
-            part_message.add_header("Content-Type", req.headers["Content-Type"])
             payload = req.serialize()
-            # We need to remove the ~HTTP/1.1 prefix along with the added content-length
-            payload = payload[payload.index(b"--") :]
+            # We need to remove the ~HTTP/1.1 prefix along with the added content-length,
+            # i.e. everything up to the blank line ending the headers. Searching for that
+            # rather than the first "--" can't stop early on a URL or header value.
+            # A memoryview avoids copying the nested body just to drop that prefix.
+            body_start = payload.index(b"\r\n\r\n") + 4
+            append(_part_bytes(memoryview(payload)[body_start:], req.headers["Content-Type"]))
         else:
-            part_message.add_header("Content-Type", "application/http")
-            part_message.add_header("Content-Transfer-Encoding", "binary")
-            part_message.add_header("Content-ID", str(content_index))
-            payload = req.serialize()
+            append(_part_bytes(req.serialize(), "application/http", content_id=content_index))
             content_index += 1
-        part_message.set_payload(payload)
-        main_message.attach(part_message)
-
-    full_message = main_message.as_bytes(policy=HTTP)
-    # From "as_bytes" doc:
-    #  Flattening the message may trigger changes to the EmailMessage if defaults need to be filled in to complete
-    #  the transformation to a string (for example, MIME boundaries may be generated or modified).
-    # After this call, we know `get_boundary` will return a valid boundary and not None. Mypy doesn't know that.
-    final_boundary: str = cast(str, main_message.get_boundary())
-    eol = b"\r\n"
-    _, _, body = full_message.split(eol, 2)
+
+    body = b"".join(
+        (
+            delimiter,
+            b"\r\n",
+            (b"\r\n" + delimiter + b"\r\n").join(parts),
+            b"\r\n",
+            delimiter,
+            b"--\r\n",
+        )
+    )
     http_request.set_bytes_body(body)
-    http_request.headers["Content-Type"] = "multipart/mixed; boundary=" + final_boundary
+    http_request.headers["Content-Type"] = f"multipart/mixed; boundary={boundary}"
     return content_index
 
 
-class _HTTPSerializer(HTTPConnection):
-    """Hacking the stdlib HTTPConnection to serialize HTTP request as strings."""
-
-    def __init__(self, *args, **kwargs):
-        self.buffer = b""
-        kwargs.setdefault("host", "fakehost")
-        super(_HTTPSerializer, self).__init__(*args, **kwargs)
-
-    def putheader(self, header, *values):
-        if header in ["Host", "Accept-Encoding"]:
-            return
-        super(_HTTPSerializer, self).putheader(header, *values)
+def _iter_body_chunks(body: Any) -> Iterator[bytes]:
+    """Iterate over the chunks of a streamed request body, the way http.client sends them.
 
-    def send(self, data):
-        self.buffer += data
+    :param any body: A file-like object or an iterable of bytes
+    :rtype: Iterator[bytes]
+    :return: The chunks of the body
+    """
+    if hasattr(body, "read"):
+        while True:
+            chunk = body.read(_BODY_READ_SIZE)
+            if not chunk:
+                return
+            yield chunk.encode("iso-8859-1") if isinstance(chunk, str) else chunk
+    try:
+        chunks = iter(body)
+    except TypeError:
+        raise TypeError(  # pylint: disable=raise-missing-from
+            f"message_body should be a bytes-like object or an iterable, got {type(body)!r}"
+        )
+    yield from chunks
+
+
+def _header_line(header: Union[str, bytes], value: Any) -> bytes:
+    """Serialize one header line, with the same encoding and checks as http.client's putheader.
+
+    :param header: The header name
+    :type header: str or bytes
+    :param any value: The header value. str, bytes and int are supported.
+    :rtype: bytes
+    :return: The header line, including the trailing CRLF
+    :raises ValueError: If the header name or value would break the header block
+    """
+    if isinstance(header, str):
+        header = header.encode("ascii")
+    if not _LEGAL_HEADER_NAME.fullmatch(header):
+        raise ValueError(f"Invalid header name {header!r}")
+    if isinstance(value, str):
+        value = value.encode("iso-8859-1")
+    elif isinstance(value, int):
+        value = str(value).encode("ascii")
+    # Values almost never contain line breaks, skip the regex when they can't match
+    if (b"\r" in value or b"\n" in value) and _ILLEGAL_HEADER_VALUE_CHARS.search(value):
+        raise ValueError(f"Invalid header value {value!r}")
+    return b"%s: %s\r\n" % (header, value)
+
+
+def _content_length(method: str, body: Any) -> Optional[int]:
+    """Get the Content-Length http.client would send for this body.
+
+    :param str method: The request method
+    :param any body: The request body, with str already encoded
+    :rtype: int or None
+    :return: The body length, or None if the body is streamed or there is no length to send
+    """
+    if body is None:
+        return 0 if method.upper() in _METHODS_EXPECTING_BODY else None
+    if hasattr(body, "read"):
+        return None
+    try:
+        return memoryview(body).nbytes
+    except TypeError:
+        return None
+
+
+def _header_lines(
+    headers: Mapping[str, Any], content_length: Optional[int], streamed: bool
+) -> Tuple[List[bytes], bool]:
+    """Serialize the header block, adding a framing header unless the caller set one.
+
+    :param headers: The request headers
+    :type headers: Mapping[str, any]
+    :param int content_length: The body length, as returned by _content_length
+    :param bool streamed: Whether the body is streamed
+    :rtype: tuple[list[bytes], bool]
+    :return: The header lines, and whether the body must be sent in chunked encoding
+    """
+    header_lines: List[bytes] = []
+    chunked = False
+    header_names = frozenset(k.lower() for k in headers)
+    if "content-length" not in header_names and "transfer-encoding" not in header_names:
+        if streamed:
+            chunked = True
+            header_lines.append(b"Transfer-Encoding: chunked\r\n")
+        elif content_length is not None:
+            header_lines.append(b"Content-Length: %d\r\n" % content_length)
+    for header, value in headers.items():
+        if header in _SKIP_HEADERS:
+            continue
+        header_lines.append(_header_line(header, value))
+    return header_lines, chunked
+
+
+def _write_streamed_body(buffer: bytearray, body: Any, chunked: bool) -> None:
+    """Append a streamed body to the serialized request.
+
+    :param bytearray buffer: The serialized request so far
+    :param any body: A file-like object or an iterable of bytes
+    :param bool chunked: Whether to frame the body in chunked encoding
+    """
+    for chunk in _iter_body_chunks(body):
+        if not chunk:
+            continue
+        if chunked:
+            buffer += f"{len(chunk):X}\r\n".encode("ascii")
+            buffer += chunk
+            buffer += b"\r\n"
+        else:
+            buffer += chunk
+    if chunked:
+        buffer += b"0\r\n\r\n"
 
 
 def _serialize_request(http_request: "HTTPRequestType") -> bytes:
@@ -199,22 +334,42 @@ def _serialize_request(http_request: "HTTPRequestType") -> bytes:
 
     Serialize a request using the application/http spec/
 
+    The output matches what http.client.HTTPConnection would send for this request,
+    minus the Host and Accept-Encoding headers it adds on its own.
+
     :param http_request: The http request which we are trying
      to serialize.
     :type http_request: any
     :rtype: bytes
     :return: The serialized request
     """
-    if isinstance(http_request.body, dict):
+    body = http_request.body
+    if isinstance(body, dict):
         raise TypeError("Cannot serialize an HTTPRequest with dict body.")
-    serializer = _HTTPSerializer()
-    serializer.request(
-        method=http_request.method,
-        url=http_request.url,
-        body=http_request.body,
-        headers=http_request.headers,
-    )
-    return serializer.buffer
+    method = http_request.method
+    url = http_request.url or "/"
+    if _ILLEGAL_METHOD_CHARS.search(method):
+        raise ValueError(f"method can't contain control characters. {method!r}")
+    if _ILLEGAL_URL_CHARS.search(url):
+        raise InvalidURL(f"URL can't contain control characters. {url!r}")
+    if isinstance(body, str):
+        # RFC 2616 Section 3.7.1 says that text default has a default charset of iso-8859-1
+        body = body.encode("iso-8859-1")
+
+    # Like http.client, file-like objects and iterables are streamed, in chunked encoding
+    # unless the caller already set a Content-Length or Transfer-Encoding header.
+    content_length = _content_length(method, body)
+    streamed = body is not None and content_length is None
+    header_lines, chunked = _header_lines(http_request.headers, content_length, streamed)
+
+    buffer = bytearray(f"{method} {url} HTTP/1.1\r\n".encode("ascii"))
+    buffer += b"".join(header_lines)
+    buffer += b"\r\n"
+    if streamed:
+        _write_streamed_body(buffer, body, chunked)
+    elif body is not None:
+        buffer += body
+    return bytes(buffer)
 
 
 def _decode_parts_helper(
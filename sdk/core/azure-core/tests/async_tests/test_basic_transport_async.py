@@ -19,6 +19,7 @@ from utils import HTTP_REQUESTS, request_and_responses_product
 import pytest
 import sys
 import aiohttp
+from pathlib import Path
 
 
 # transport = mock.MagicMock(spec=AsyncHttpTransport)
@@ -993,3 +994,114 @@ async def test_aiohttp_errors():
     generator = AioHttpStreamDownloadGenerator(None, response)
     with pytest.raises(ServiceResponseError):
         await generator.__anext__()
+
+
+class MockAiohttpSession:
+    def __init__(self):
+        self.auto_decompress = False
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def close(self):
+        pass
+
+    async def request(self, method, url, **kwargs):
+        self.calls.append(kwargs)
+        return MockAiohttpResponse()
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_proxies():
+    session = MockAiohttpSession()
+    transport = AioHttpTransport(session=session, session_owner=False)
+    proxies = {"http": "http://httpproxy", "https": "http://httpsproxy"}
+
+    await transport.send(HttpRequest("GET", "https://example.org"), stream=True, proxies=proxies)
+    assert session.calls[-1]["proxy"] == "http://httpsproxy"
+    await transport.send(HttpRequest("GET", "http://example.org"), stream=True, proxies=proxies)
+    assert session.calls[-1]["proxy"] == "http://httpproxy"
+
+    del proxies["https"]
+    await transport.send(HttpRequest("GET", "https://example.org"), stream=True, proxies=proxies)
+    assert session.calls[-1]["proxy"] == "http://httpproxy"
+    await transport.send(HttpRequest("GET", "ftp://example.org"), stream=True, proxies=proxies)
+    assert session.calls[-1]["proxy"] is None
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_timeouts():
+    session = MockAiohttpSession()
+    transport = AioHttpTransport(session=session, session_owner=False, connection_timeout=10, read_timeout=20)
+
+    await transport.send(HttpRequest("GET", "http://example.org"), stream=True)
+    assert session.calls[-1]["timeout"].sock_connect == 10
+    assert session.calls[-1]["timeout"].sock_read == 20
+
+    await transport.send(HttpRequest("GET", "http://example.org"), stream=True, read_timeout=5)
+    assert session.calls[-1]["timeout"].sock_connect == 10
+    assert session.calls[-1]["timeout"].sock_read == 5
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_ssl_config_cache(tmp_path):
+    certifi = pytest.importorskip("certifi")
+    ca_a = tmp_path / "ca_a.pem"
+    ca_b = tmp_path / "ca_b.pem"
+    for ca_file in (ca_a, ca_b):
+        ca_file.write_bytes(Path(certifi.where()).read_bytes())
+    transport = AioHttpTransport()
+
+    assert transport._build_ssl_config(cert=None, verify=True) is True
+    context = transport._build_ssl_config(cert=None, verify=str(ca_a))
+    assert transport._build_ssl_config(cert=None, verify=str(ca_a)) is context
+
+    # Short lived Path objects are keyed by value, not by id, which CPython reuses
+    context_a = transport._build_ssl_config(cert=None, verify=Path(ca_a))
+    context_b = transport._build_ssl_config(cert=None, verify=Path(ca_b))
+    assert context_a is not context_b
+    assert transport._build_ssl_config(cert=None, verify=Path(ca_a)) is context_a
+    assert transport._build_ssl_config(cert=None, verify=Path(ca_b)) is context_b
+    assert len(transport._ssl_cache) == 3
+
+    class UnhashablePath:
+        __hash__ = None
+
+        def __init__(self, path):
+            self.path = path
+
+        def __fspath__(self):
+            return self.path
+
+    verify = UnhashablePath(str(ca_a))
+    assert transport._build_ssl_config(cert=None, verify=verify) is not transport._build_ssl_config(
+        cert=None, verify=verify
+    )
+    assert len(transport._ssl_cache) == 3
+
+    # Closing drops cached contexts, so files rotated on disk are read again
+    await transport.close()
+    assert transport._build_ssl_config(cert=None, verify=str(ca_a)) is not context
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_open_enters_session_once():
+    class CountingSession(MockAiohttpSession):
+        def __init__(self):
+            super().__init__()
+            self.entered = 0
+
+        async def __aenter__(self):
+            self.entered += 1
+            return self
+
+    session = CountingSession()
+    transport = AioHttpTransport(session=session, session_owner=False)
+    await transport.send(HttpRequest("GET", "http://example.org"), stream=True)
+    await transport.send(HttpRequest("GET", "http://example.org"), stream=True)
+    assert session.entered == 1
+
+    await transport.close()
+    await transport.send(HttpRequest("GET", "http://example.org"), stream=True)
+    assert session.entered == 2
@@ -136,3 +136,43 @@ async def test_response_streaming_error_behavior(http_response):
     with pytest.raises(requests.exceptions.ConnectionError):
         while True:
             await downloader.__anext__()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+@pytest.mark.parametrize("size", [100 * 1024, 4 * 1024 + 3])
+async def test_aiohttp_stream_decompress_bounded_by_block_size(encoding, size):
+    import zlib
+
+    block_size = 1024
+    data = b"a" * size
+    # gzip's trailer keeps the last input bytes unconsumed, raw deflate doesn't have one
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS if encoding == "gzip" else -zlib.MAX_WBITS)
+    compressed = compressor.compress(data) + compressor.flush()
+    assert len(compressed) < block_size
+
+    class MockContent:
+        def __init__(self):
+            self._chunks = [compressed]
+
+        async def read(self, block_size):
+            return self._chunks.pop(0) if self._chunks else b""
+
+    class MockInternalResponse:
+        def __init__(self):
+            self.headers = {"Content-Encoding": encoding}
+            self.content = MockContent()
+
+        def close(self):
+            pass
+
+    class MockResponse:
+        def __init__(self):
+            self.request = None
+            self.internal_response = MockInternalResponse()
+            self.block_size = block_size
+
+    stream = AioHttpStreamDownloadGenerator(None, MockResponse())
+    chunks = [chunk async for chunk in stream]
+    assert all(len(chunk) <= block_size for chunk in chunks)
+    assert b"".join(chunks) == data
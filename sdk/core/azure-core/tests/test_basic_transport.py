@@ -3,8 +3,9 @@
 # Licensed under the MIT License. See LICENSE.txt in the project root for
 # license information.
 # -------------------------------------------------------------------------
-from http.client import HTTPConnection
+from http.client import HTTPConnection, InvalidURL
 from collections import OrderedDict
+from io import BytesIO
 import sys
 
 try:
@@ -27,6 +28,7 @@ from utils import (
 )
 from azure.core.rest._http_response_impl import HttpResponseImpl as RestHttpResponseImpl
 from azure.core.pipeline._tools import is_rest
+from azure.core.utils._pipeline_transport_rest_shared import _serialize_request
 
 
 class PipelineTransportMockResponse(PipelineTransportHttpResponse):
@@ -119,6 +121,88 @@ def test_http_request_serialization(http_request):
     assert serialized == expected
 
 
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_serialize_request_str_and_bytes_body(http_request):
+    request = http_request("PUT", "/container0/blob0")
+    request.set_bytes_body(b"\x00bytes\n")
+    assert _serialize_request(request) == b"PUT /container0/blob0 HTTP/1.1\r\nContent-Length: 7\r\n\r\n\x00bytes\n"
+
+    request = http_request("PUT", "/container0/blob0")
+    request.set_text_body("caf\xe9")
+    assert _serialize_request(request).endswith(b"\r\n\r\ncaf\xe9")
+
+    request = http_request("POST", "/container0/blob0")
+    assert _serialize_request(request) == b"POST /container0/blob0 HTTP/1.1\r\nContent-Length: 0\r\n\r\n"
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_serialize_request_header_values(http_request):
+    request = http_request("GET", "/container0/blob0", headers={"X-Bytes": b"raw", "X-Int": 5, "X-Str": "caf\xe9"})
+    assert _serialize_request(request) == (
+        b"GET /container0/blob0 HTTP/1.1\r\n" b"X-Bytes: raw\r\n" b"X-Int: 5\r\n" b"X-Str: caf\xe9\r\n" b"\r\n"
+    )
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_serialize_request_chunked_body(http_request):
+    request = http_request("PUT", "/container0/blob0")
+    request.set_streamed_data_body(iter([b"ab", b"", b"cdefghijklmnopq"]))
+    assert _serialize_request(request) == (
+        b"PUT /container0/blob0 HTTP/1.1\r\n"
+        b"Transfer-Encoding: chunked\r\n"
+        b"\r\n"
+        b"2\r\nab\r\n"
+        b"F\r\ncdefghijklmnopq\r\n"
+        b"0\r\n\r\n"
+    )
+
+    request = http_request("PUT", "/container0/blob0")
+    request.set_streamed_data_body(BytesIO(b"file content"))
+    assert _serialize_request(request) == (
+        b"PUT /container0/blob0 HTTP/1.1\r\n"
+        b"Transfer-Encoding: chunked\r\n"
+        b"\r\n"
+        b"C\r\nfile content\r\n"
+        b"0\r\n\r\n"
+    )
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_serialize_request_streamed_body_with_explicit_framing(http_request):
+    request = http_request("PUT", "/container0/blob0", headers={"Content-Length": "5"})
+    request.set_streamed_data_body(iter([b"ab", b"cde"]))
+    assert _serialize_request(request) == b"PUT /container0/blob0 HTTP/1.1\r\nContent-Length: 5\r\n\r\nabcde"
+
+    request = http_request("PUT", "/container0/blob0", headers={"Transfer-Encoding": "chunked"})
+    request.set_streamed_data_body(iter([b"2\r\nab\r\n0\r\n\r\n"]))
+    assert _serialize_request(request) == (
+        b"PUT /container0/blob0 HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n2\r\nab\r\n0\r\n\r\n"
+    )
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_serialize_request_streamed_body_errors(http_request):
+    def body():
+        yield b"ab"
+        raise TypeError("bug")
+
+    request = http_request("PUT", "/container0/blob0")
+    request.set_streamed_data_body(body())
+    with pytest.raises(TypeError, match="bug"):
+        _serialize_request(request)
+
+
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_serialize_request_rejects_injection(http_request):
+    for headers in ({"X-B\r\nEvil": "1"}, {"X:B": "1"}, {"X-B": "a\r\nEvil: 1"}, {"X-B": b"a\nEvil: 1"}):
+        with pytest.raises(ValueError):
+            _serialize_request(http_request("GET", "/container0/blob0", headers=headers))
+    with pytest.raises(ValueError):
+        _serialize_request(http_request("GET\r\n", "/container0/blob0"))
+    with pytest.raises(InvalidURL):
+        _serialize_request(http_request("GET", "/container0/blob0 HTTP/1.1\r\nEvil: 1"))
+
+
 @pytest.mark.parametrize("http_request", HTTP_REQUESTS)
 def test_url_join(http_request):
     assert _urljoin("devstoreaccount1", "") == "devstoreaccount1/"
@@ -129,6 +213,14 @@ def test_url_join(http_request):
     assert _urljoin("devstoreaccount1", "testdir/?b=2") == "devstoreaccount1/testdir/?b=2"
     assert _urljoin("devstoreaccount1?a=1", "testdir/?b=2") == "devstoreaccount1/testdir/?a=1&b=2"
     assert _urljoin("devstoreaccount1", "documentModels:build") == "devstoreaccount1/documentModels:build"
+    assert _urljoin("https://a.b", "c") == "https://a.b/c"
+    assert _urljoin("https://a.b/", "c/") == "https://a.b/c/"
+    assert _urljoin("https://a.b/path?a=1", "c?b=2") == "https://a.b/path/c?a=1&b=2"
+    assert _urljoin("https://a.b/path?a=1#frag", "c") == "https://a.b/path/c?a=1#frag"
+    assert _urljoin("https://a.b/path?", "c?") == "https://a.b/path/c"
+    assert _urljoin("HTTPS://A.B/p", "c") == "https://A.B/p/c"
+    assert _urljoin("Https://A.B/p?a=1", "c?b=2") == "https://A.B/p/c?a=1&b=2"
+    assert _urljoin("Document:build?a=1", "c") == "document:build/c?a=1"
 
 
 @pytest.mark.parametrize("http_request,http_response", request_and_responses_product(HTTP_CLIENT_TRANSPORT_RESPONSES))
@@ -261,6 +353,37 @@ def test_multipart_send(http_request):
     )
 
 
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_multipart_send_keeps_body_bytes(http_request):
+    transport = mock.MagicMock(spec=HttpTransport)
+
+    req0 = http_request("PATCH", "/container0/blob0")
+    req0.set_bytes_body(b"line1\nline2\r")
+
+    request = http_request("POST", "http://account.blob.core.windows.net/?comp=batch")
+    request.set_multipart_mixed(
+        req0,
+        boundary="batch_357de4f7-6d0b-4e02-8cd2-6361411a9525",
+    )
+
+    with Pipeline(transport) as pipeline:
+        pipeline.run(request)
+
+    assert request.body == (
+        b"--batch_357de4f7-6d0b-4e02-8cd2-6361411a9525\r\n"
+        b"Content-Type: application/http\r\n"
+        b"Content-Transfer-Encoding: binary\r\n"
+        b"Content-ID: 0\r\n"
+        b"\r\n"
+        b"PATCH /container0/blob0 HTTP/1.1\r\n"
+        b"Content-Length: 12\r\n"
+        b"\r\n"
+        b"line1\nline2\r"
+        b"\r\n"
+        b"--batch_357de4f7-6d0b-4e02-8cd2-6361411a9525--\r\n"
+    )
+
+
 @pytest.mark.parametrize("http_request", HTTP_REQUESTS)
 def test_multipart_send_with_context(http_request):
     transport = mock.MagicMock(spec=HttpTransport)
@@ -358,6 +481,34 @@ def test_multipart_send_with_one_changeset(http_request):
     )
 
 
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+def test_multipart_send_with_changeset_header_dashes(http_request):
+    transport = mock.MagicMock(spec=HttpTransport)
+
+    changeset = http_request("", "", headers={"x-ms-client-request-id": "id--with--dashes"})
+    changeset.set_multipart_mixed(
+        http_request("DELETE", "/container0/blob0"),
+        boundary="changeset_357de4f7-6d0b-4e02-8cd2-6361411a9525",
+    )
+
+    request = http_request("POST", "http://account.blob.core.windows.net/?comp=batch")
+    request.set_multipart_mixed(
+        changeset,
+        boundary="batch_357de4f7-6d0b-4e02-8cd2-6361411a9525",
+    )
+
+    with Pipeline(transport) as pipeline:
+        pipeline.run(request)
+
+    assert request.body.startswith(
+        b"--batch_357de4f7-6d0b-4e02-8cd2-6361411a9525\r\n"
+        b"Content-Type: multipart/mixed; boundary=changeset_357de4f7-6d0b-4e02-8cd2-6361411a9525\r\n"
+        b"\r\n"
+        b"--changeset_357de4f7-6d0b-4e02-8cd2-6361411a9525\r\n"
+    )
+    assert b"id--with--dashes" not in request.body
+
+
 @pytest.mark.parametrize("http_request", HTTP_REQUESTS)
 def test_multipart_send_with_multiple_changesets(http_request):
 
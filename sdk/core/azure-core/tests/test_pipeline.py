@@ -75,6 +75,13 @@ def test_default_http_logging_policy(http_request):
     HttpLoggingPolicy.DEFAULT_HEADERS_WHITELIST = set(HttpLoggingPolicy.DEFAULT_HEADERS_ALLOWLIST)
 
 
+def test_configuration_accepts_extra_attributes():
+    config = Configuration(polling_interval=5)
+    config.max_single_put_size = 1
+    assert config.max_single_put_size == 1
+    assert config.polling_interval == 5
+
+
 @pytest.mark.parametrize("http_request", HTTP_REQUESTS)
 def test_pass_in_http_logging_policy(http_request):
     config = Configuration()
@@ -192,6 +199,12 @@ def test_format_url_full_url():
     assert formatted == "https://google.com/subpath/bar"
 
 
+def test_format_url_absolute_prefix_without_host():
+    client = PipelineClientBase("https://bing.com")
+    assert client.format_url("https:///subpath") == "https://bing.com/https:///subpath"
+    assert client.format_url("http://") == "https://bing.com/http://"
+
+
 def test_format_url_no_base_url():
     client = PipelineClientBase(None)
     formatted = client.format_url("https://google.com/subpath/{foo}", foo="bar")
@@ -204,6 +217,15 @@ def test_format_url_double_query():
     assert formatted == "https://bing.com/path/subpath?query=testvalue&x=2ndvalue&a=X&c=Y"
 
 
+def test_format_url_base_url_changed():
+    client = PipelineClientBase("https://bing.com/path/")
+    assert client.format_url("") == "https://bing.com/path/"
+    assert client.format_url("/{foo}", foo="bar") == "https://bing.com/path/bar"
+    client._base_url = "{Endpoint}/other"
+    assert client.format_url("/{foo}", foo="bar", Endpoint="https://google.com") == "https://google.com/other/bar"
+    assert client.format_url("", Endpoint="https://google.com") == "https://google.com/other"
+
+
 def test_format_url_braces_with_dot():
     base_url = "https://bing.com/{aaa.bbb}"
     with pytest.raises(ValueError):
@@ -216,6 +238,11 @@ def test_format_url_single_brace():
         url = _format_url_section(base_url)
 
 
+def test_format_url_section_skips_missing_params():
+    assert _format_url_section("/subpath/{a}/{b}/{{c}}/{d:>2}", a="X", d="Y") == "/subpath/X/{c}/ Y"
+    assert _format_url_section("{Endpoint}/x-{a}-y/z") == "z"
+
+
 def test_format_incorrect_endpoint():
     # https://github.com/Azure/azure-sdk-for-python/pull/12106
     client = PipelineClientBase("{Endpoint}/text/analytics/v3.0")